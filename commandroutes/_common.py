@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+_common.py — shared plumbing for the commandroutes entry scripts.
+
+start.py and startgetaudio.py grew near-identical copies of the same
+helpers (logging, repo discovery, getlink integration, downloader
+invocation, output parsing, menu return). They live here once now; the
+entry scripts import what they need and keep only their own flow.
+"""
+
+import os
+import re
+import sys
+import json
+import collections
+import shutil
+import functools
+import threading
+import importlib.util
+import inspect
+import subprocess
+import time
+from typing import Optional, Tuple, List
+
+# -------------------- Logging --------------------
+
+# log() can fire per streamed child line; reformat the timestamp only when
+# the wall-clock second actually changes (time.strftime also skips the
+# datetime-object construction the old datetime.now().strftime did).
+_NOW_CACHE: Tuple[int, str] = (-1, "")
+
+def now() -> str:
+    global _NOW_CACHE
+    t = int(time.time())
+    if t != _NOW_CACHE[0]:
+        _NOW_CACHE = (t, time.strftime("%Y-%m-%d %H:%M:%S"))
+    return _NOW_CACHE[1]
+
+def log(msg: str) -> None:
+    print(f"[{now()}] {msg}")
+
+def hr() -> None:
+    print("-" * 72)
+
+# -------------------- Path helpers --------------------
+
+@functools.cache
+def repo_root_from_here() -> str:
+    here = os.path.abspath(__file__)
+    return os.path.dirname(os.path.dirname(here))
+
+@functools.lru_cache(maxsize=8)
+def candidate_content_roots(repo_root: str) -> Tuple[str, ...]:
+    parent = os.path.dirname(repo_root)
+    return (
+        os.path.join(repo_root, "youtube2audwstems"),
+        os.path.join(repo_root, "link2stems"),
+        os.path.join(parent, "youtube2audwstems"),
+        os.path.join(parent, "link2stems"),
+    )
+
+@functools.lru_cache(maxsize=128)
+def _find_file(repo_root: str, rel_parts: Tuple[str, ...]) -> Optional[str]:
+    for root in candidate_content_roots(repo_root):
+        p = os.path.join(root, *rel_parts)
+        if os.path.isfile(p):
+            return p
+    return None
+
+def find_getlink(repo_root: str) -> Optional[str]:
+    return _find_file(repo_root, ("getlink.py",))
+
+@functools.lru_cache(maxsize=16)
+def _scan_script_dir(dir_path: str) -> frozenset:
+    """.py filenames in one directory via a single scandir pass ('' set if absent)."""
+    try:
+        with os.scandir(dir_path) as it:
+            return frozenset(e.name for e in it if e.is_file() and e.name.endswith(".py"))
+    except OSError:
+        return frozenset()
+
+def find_youtube_methods(repo_root: str) -> List[str]:
+    # One scandir per candidate methods/youtube dir instead of an isfile
+    # probe per (root, method) pair.
+    scans = [
+        (d, _scan_script_dir(d))
+        for d in (os.path.join(r, "methods", "youtube") for r in candidate_content_roots(repo_root))
+    ]
+    paths = []
+    for name in ("method1.py", "method2.py", "method3.py"):
+        for d, names in scans:
+            if name in names:
+                paths.append(os.path.join(d, name))
+                break
+    if not paths:
+        p = _find_file(repo_root, ("methods", "method1.py"))
+        if p:
+            paths.append(p)
+    return paths
+
+def find_instagram_method(repo_root: str) -> Optional[str]:
+    return _find_file(repo_root, ("methods", "instagram", "instamethod1.py"))
+
+def find_menu(repo_root: str) -> Optional[str]:
+    p = os.path.join(repo_root, "menu.py")
+    return p if os.path.isfile(p) else None
+
+# -------------------- Import helper --------------------
+
+def import_by_path(module_name: str, file_path: str):
+    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load spec for {module_name} at {file_path}")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)  # type: ignore
+    return mod
+
+# -------------------- getlink integration --------------------
+
+def call_getlink(getlink_mod) -> Tuple[str, str]:
+    """
+    Accepts:
+      get_link_info() -> {"platform": "...", "url": "..."} | (platform, url) | JSON str
+      get_link()      -> "<url>"  (platform inferred)
+      main()/run()    -> any of the above
+    Returns (platform, url)
+    """
+    if hasattr(getlink_mod, "get_link_info"):
+        info = getlink_mod.get_link_info()
+        if isinstance(info, dict) and info.get("platform") and info.get("url"):
+            return (str(info["platform"]).strip(), str(info["url"]).strip())
+        if isinstance(info, (list, tuple)) and len(info) >= 2:
+            return (str(info[0]).strip(), str(info[1]).strip())
+        if isinstance(info, str):
+            try:
+                obj = json.loads(info)
+                if obj.get("platform") and obj.get("url"):
+                    return (str(obj["platform"]).strip(), str(obj["url"]).strip())
+            except Exception:
+                pass
+
+    if hasattr(getlink_mod, "get_link"):
+        url = str(getlink_mod.get_link()).strip()
+        if url:
+            return (infer_platform_from_url(url), url)
+
+    for fn in ("main", "run"):
+        if hasattr(getlink_mod, fn):
+            res = getattr(getlink_mod, fn)()
+            if isinstance(res, dict) and res.get("platform") and res.get("url"):
+                return (str(res["platform"]).strip(), str(res["url"]).strip())
+            if isinstance(res, (list, tuple)) and len(res) >= 2:
+                return (str(res[0]).strip(), str(res[1]).strip())
+            if isinstance(res, str):
+                url = res.strip()
+                if url:
+                    return (infer_platform_from_url(url), url)
+
+    raise ValueError("getlink.py did not provide a usable link/platform.")
+
+# -------------------- Platform detection --------------------
+
+def infer_platform_from_url(url: str) -> str:
+    # plain substring checks beat the regex engine for fixed host names
+    u = url.lower()
+    if "youtube.com" in u or "youtu.be" in u:
+        return "youtube"
+    if "instagram.com" in u:
+        return "instagram"
+    return "youtube"
+
+def normalize_platform(p: str) -> str:
+    s = (p or "").strip().lower()
+    if "youtube" in s or "short" in s:
+        return "youtube"
+    if "instagram" in s:
+        return "instagram"
+    return "youtube"
+
+# -------------------- Dependency probes --------------------
+# Cached so a missing tool is learned once per run; an O(1) dict hit beats
+# finding out by spawning a child that crashes during import/exec.
+
+@functools.lru_cache(maxsize=None)
+def have_cli(name: str) -> bool:
+    return shutil.which(name) is not None
+
+@functools.lru_cache(maxsize=None)
+def have_module(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except Exception:
+        return False
+
+# -------------------- Downloader (in-process + CLI fallback) --------------------
+
+class DownloaderTransient(Exception):
+    """Method ran but failed for environmental reasons (network, throttling).
+    Re-running the same code in a fresh interpreter won't help."""
+
+class DownloaderBroken(Exception):
+    """Method couldn't be driven in-process; worth retrying as a CLI script."""
+
+_METHOD_MOD_CACHE: dict = {}
+
+def _load_method_module(method_path: str):
+    # Cache compiled method modules so a retry of the same path skips
+    # tokenize/compile/exec. Keyed by mtime, so editing a method script
+    # mid-session loads the fresh code instead of a stale module; a unique
+    # module name per path keeps repeated loads from shadowing each other.
+    try:
+        mtime = os.stat(method_path).st_mtime_ns
+    except OSError:
+        mtime = -1
+    key = (method_path, mtime)
+    mod = _METHOD_MOD_CACHE.get(key)
+    if mod is None:
+        mod = import_by_path(f"_meth_{abs(hash(method_path)):x}", method_path)
+        _METHOD_MOD_CACHE[key] = mod
+    return mod
+
+_POSSIBLE_OUTPUT_ATTRS = (
+    "LAST_OUTPUT_PATH", "OUTPUT_PATH", "last_output", "last_file", "output_path"
+)
+
+# strip whitespace and shell quoting in one pass instead of three chained
+# .strip() calls, each of which walks and reallocates the string
+_QUOTE_WS = " \t\r\n\"'"
+
+def _normalize_path(p: Optional[str]) -> Optional[str]:
+    if not p or not isinstance(p, str):
+        return None
+    p = p.strip(_QUOTE_WS)
+    return os.path.abspath(p) if os.path.exists(p) else None
+
+def _output_from_module_vars(mod) -> Optional[str]:
+    for name in _POSSIBLE_OUTPUT_ATTRS:
+        if hasattr(mod, name):
+            p = getattr(mod, name)
+            norm = _normalize_path(p if isinstance(p, str) else None)
+            if norm:
+                return norm
+    return None
+
+@functools.lru_cache(maxsize=64)
+def _wants_url_arg(func) -> bool:
+    """Whether func takes the URL positionally. Resolved once per callable —
+    inspect.signature re-parses the whole parameter list on every call."""
+    code = getattr(func, "__code__", None)
+    if code is not None:
+        required = code.co_argcount - len(getattr(func, "__defaults__", None) or ())
+        return required >= 1
+    sig = inspect.signature(func)
+    return any(
+        p.kind in (inspect.Parameter.POSITIONAL_ONLY,
+                   inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        and p.default is inspect.Parameter.empty
+        for p in sig.parameters.values()
+    )
+
+def _invoke_callable(func, url: str, mod) -> Optional[str]:
+    if _wants_url_arg(func):
+        rv = func(url)
+    else:
+        os.environ["YT2AUDIO_URL"] = url
+        rv = func()
+    return _normalize_path(rv) or _output_from_module_vars(mod)
+
+def call_downloader_inprocess(mod, url: str) -> Optional[str]:
+    attempted = False
+    last_exc: Optional[Exception] = None
+    for fn in ("download_audio", "download", "run", "main"):
+        if hasattr(mod, fn):
+            attempted = True
+            try:
+                out_path = _invoke_callable(getattr(mod, fn), url, mod)
+                if out_path:
+                    return os.path.abspath(out_path)
+            except Exception as e:
+                last_exc = e
+                continue
+    if not attempted:
+        raise DownloaderBroken("module exposes no download_audio/download/run/main")
+    if last_exc is not None:
+        raise DownloaderTransient(str(last_exc))
+    return None
+
+# Scan untrusted downloader output with RE2 (linear-time DFA) when it's
+# installed, so adversarial log lines can't trigger backtracking blowups.
+# Falls back to stdlib re; the pattern uses no backreferences, so both
+# engines accept it unchanged.
+try:
+    import re2 as _re_engine  # type: ignore
+except ImportError:
+    _re_engine = re
+
+_PATH_RE = _re_engine.compile(r'(/[^:\n\r\t]*?\.(?:wav|mp3|m4a|aac|flac|ogg|opus))', re.IGNORECASE)
+# bound once — skips the attribute lookup on every scanned chunk of output
+_path_finditer = _PATH_RE.finditer
+
+def _pick_path_from_text(s: str) -> Optional[str]:
+    if not s:
+        return None
+    # The wanted path is almost always the last one mentioned, so keep just
+    # a short tail of matches instead of materializing every hit in a
+    # 100KB-of-yt-dlp-output worst case, then validate newest-first.
+    tail = collections.deque(maxlen=8)
+    for m in _path_finditer(s):
+        tail.append(m.group(1))
+    for cand in reversed(tail):
+        p = cand.strip(_QUOTE_WS)
+        if os.path.isabs(p) and os.path.exists(p):
+            return os.path.abspath(p)
+    return None
+
+# -------------------- CLI runner --------------------
+
+@functools.cache
+def _base_env() -> dict:
+    # snapshot os.environ once; children get a cheap patched copy per launch
+    return dict(os.environ)
+
+def _pump_stream(stream, sink, tail: List[str], tail_lines: int = 512) -> None:
+    """Forward child output line by line, keeping only a bounded tail for parsing."""
+    for line in stream:
+        sink.write(line)
+        sink.flush()
+        tail.append(line)
+        if len(tail) > tail_lines:
+            del tail[: tail_lines // 2]
+
+def run_cli(python_exe: str, script_path: str, url: str, cwd: Optional[str] = None,
+            capture: bool = True):
+    """
+    Run a method script, streaming its stdout/stderr to ours as it arrives
+    (instead of buffering everything until exit). Returns the bounded tails
+    of each stream — enough for _pick_path_from_text, with bounded memory.
+
+    With capture=False the child inherits our fds directly — the kernel
+    forwards its output with no Python in the loop (and no newline
+    re-translation on Windows). Use it when the output won't be scanned;
+    the returned tails are empty strings.
+    """
+    env = {**_base_env(), "YT2AUDIO_URL": url}
+    if not capture:
+        proc = subprocess.Popen(
+            [python_exe, script_path, url],
+            cwd=cwd,
+            env=env,
+        )
+        proc.wait()
+        return proc.returncode, "", ""
+    proc = subprocess.Popen(
+        [python_exe, script_path, url],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+        cwd=cwd,
+        env=env,
+    )
+    out_tail: List[str] = []
+    err_tail: List[str] = []
+    pumps = [
+        threading.Thread(target=_pump_stream, args=(proc.stdout, sys.stdout, out_tail), daemon=True),
+        threading.Thread(target=_pump_stream, args=(proc.stderr, sys.stderr, err_tail), daemon=True),
+    ]
+    for t in pumps:
+        t.start()
+    proc.wait()
+    for t in pumps:
+        t.join()
+    return proc.returncode, "".join(out_tail), "".join(err_tail)
+
+def try_one_method(method_path: str, url: str) -> Optional[str]:
+    # The youtube methods need yt-dlp up front — bail before paying for an
+    # interpreter spawn that would only crash. The instagram method installs
+    # yt-dlp itself when missing (ensure_yt_dlp), so it gets to run anyway.
+    self_provisioning = os.path.basename(method_path).startswith("instamethod")
+    if not self_provisioning and not (have_cli("yt-dlp") or have_module("yt_dlp")):
+        log("Skipping downloader: yt-dlp not found (neither binary nor module).")
+        return None
+    log(f"Selected downloader: {method_path}")
+    # In-process first
+    try:
+        mod = _load_method_module(method_path)
+    except Exception:
+        mod = None  # couldn't load in-process; the CLI run may still work
+    if mod is not None:
+        try:
+            out_path = call_downloader_inprocess(mod, url)
+            if out_path:
+                return out_path
+        except DownloaderTransient as e:
+            # The downloader itself failed (network etc.); a fresh interpreter
+            # re-running the same code won't do better — skip to next method.
+            log(f"Downloader failed in-process ({e}); trying next method.")
+            return None
+        except (DownloaderBroken, SystemExit):
+            pass
+    # CLI fallback (run_cli already streams the child's output live)
+    log("Falling back to CLI execution of downloader…")
+    code, out, err = run_cli(sys.executable, method_path, url, cwd=os.path.dirname(method_path))
+    detected = _pick_path_from_text(out) or _pick_path_from_text(err)
+    if detected:
+        return detected
+    return None
+
+# -------------------- Menu return --------------------
+
+def return_to_menu(repo_root: str) -> None:
+    menu_path = find_menu(repo_root)
+    if not menu_path:
+        hr()
+        log("menu.py not found next to repo root; exiting to shell.")
+        return
+    hr()
+    log("Returning to menu…")
+    # Call menu.main() in-process when possible — execv re-pays interpreter
+    # startup and re-imports everything from scratch. Keep execv as the
+    # fallback for a menu.py without a main() entry point; it replaces the
+    # process entirely, so there's no recursion risk either way.
+    try:
+        menu_mod = import_by_path("menu", menu_path)
+        menu_main = getattr(menu_mod, "main", None)
+    except Exception:
+        menu_main = None
+    if callable(menu_main):
+        menu_main()
+        return
+    try:
+        os.execv(sys.executable, [sys.executable, menu_path])
+    except Exception as e:
+        log("Failed to reload menu.py automatically; please run it manually.")
+        log(str(e))
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+_picker_launch.py — open a file-picker script in a new terminal window.
+
+startaisplitter.py and startdetails.py carried two diverging copies of the
+osascript/PowerShell/Linux-terminal dispatch, each with its own escape
+logic. This is the single code path both now use: the launch command is
+written to an executable script file and the terminal runs that path, so
+there is no inline quoting to get wrong, and on macOS `open -a Terminal`
+dispatches the script directly — no osascript interpreter per launch.
+"""
+
+import os
+import sys
+import shlex
+import shutil
+import subprocess
+from typing import Optional, Sequence
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_REPO_ROOT = os.path.dirname(_HERE)
+_MAC_TMP_DIR = os.path.expanduser("~/Library/Application Support/MusicTechTools/tmp")
+
+_ENSURED_DIRS: set = set()
+
+def _ensure_dir(p: str) -> None:
+    if p not in _ENSURED_DIRS:
+        os.makedirs(p, exist_ok=True)
+        _ENSURED_DIRS.add(p)
+
+def _script_store_dir() -> str:
+    d = _MAC_TMP_DIR if sys.platform == "darwin" else os.path.join(_REPO_ROOT, ".tmp")
+    _ensure_dir(d)
+    return d
+
+def _write_launcher_script(name: str, content: str) -> str:
+    """Write the launch command to an executable script file; the terminal
+    then runs a plain path instead of re-parsing an escaped inline string."""
+    path = os.path.join(_script_store_dir(), name)
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(content)
+    os.chmod(path, 0o755)
+    return path
+
+def launch_picker(picker_py: str, temp_path: str, env_var: str = "PICKER_TEMP_PATH",
+                  title: Optional[str] = None, working_dir: Optional[str] = None,
+                  extra_args: Sequence[str] = (), log=print) -> Optional[subprocess.Popen]:
+    """Launch picker_py in a new terminal window with a real TTY.
+
+    The picker receives the result file path via env_var (and any
+    extra_args); the caller is responsible for watching temp_path.
+
+    Returns the picker's own Popen handle when it runs in-process (the
+    shell fallback), so callers can detect a cancelled picker by its
+    exit. Returns None when the picker is detached into a terminal app
+    (Terminal.app, PowerShell, gnome-terminal, …), whose launcher
+    process exits immediately.
+    """
+    title = title or os.path.basename(picker_py)
+    parts = []
+    if working_dir:
+        parts.append(f'cd {shlex.quote(working_dir)}')
+    parts.append(f'export {env_var}={shlex.quote(temp_path)}')
+    parts.append(" ".join(
+        [shlex.quote(sys.executable), shlex.quote(picker_py)]
+        + [shlex.quote(a) for a in extra_args]
+    ))
+    parts.append(r'printf "\nDone. You can close this window.\n"')
+    parts.append('exec $SHELL')
+    inner = "; ".join(parts)
+    log(f"Picker command (inner shell): {inner}")
+
+    if sys.platform == "darwin":
+        # `open` dispatches straight through Launch Services — no osascript
+        # interpreter to spawn and no AppleScript to parse per launch. The
+        # OSC escape sets the window/tab title from inside the script, which
+        # is the one thing the AppleScript was still doing.
+        cmd_file = _write_launcher_script(
+            "launch_picker.command",
+            f"#!/bin/bash\nprintf '\\033]0;%s\\007' {shlex.quote(title)}\n{inner}\n",
+        )
+        log("Launching macOS Terminal via open -a Terminal.")
+        subprocess.Popen(["open", "-a", "Terminal", cmd_file])
+    elif os.name == "nt":
+        # PowerShell has its own syntax — single-quoted literals with ''
+        # escaping, $env: assignment, and & to invoke a quoted command.
+        def _ps_quote(s: str) -> str:
+            return "'" + s.replace("'", "''") + "'"
+        ps_lines = [f'$host.ui.RawUI.WindowTitle = {_ps_quote(title)}']
+        if working_dir:
+            ps_lines.append(f'Set-Location {_ps_quote(working_dir)}')
+        ps_lines.append(f'$env:{env_var} = {_ps_quote(temp_path)}')
+        ps_lines.append("& " + " ".join(
+            _ps_quote(a) for a in [sys.executable, picker_py, *extra_args]
+        ))
+        ps_lines.append('Write-Host ""')
+        ps_lines.append("Write-Host 'Done. You can close this window.'")
+        ps1_file = _write_launcher_script("launch_picker.ps1", "\n".join(ps_lines) + "\n")
+        log("Launching Windows PowerShell via Start-Process.")
+        subprocess.Popen([
+            "powershell", "-NoProfile", "-Command",
+            f"Start-Process powershell -ArgumentList '-NoExit', '-NoProfile', '-File', '{ps1_file}'"
+        ])
+    else:
+        sh_file = _write_launcher_script("launch_picker.sh", f"#!/bin/sh\n{inner}\n")
+        for term, flag in (("gnome-terminal", "--"), ("konsole", "-e"), ("xterm", "-e")):
+            if shutil.which(term):
+                log(f"Launching picker in {term}…")
+                subprocess.Popen([term, flag, sh_file])
+                return None
+        # Inline fallback: run the picker directly (no launcher script, no
+        # trailing shell) so the returned handle exits when the picker does —
+        # that exit is what lets callers detect a cancelled picker.
+        log("No external terminal detected; running picker in this terminal.")
+        env = {**os.environ, env_var: temp_path}
+        return subprocess.Popen(
+            [sys.executable, picker_py, *extra_args],
+            env=env, cwd=working_dir or None,
+        )
+    return None
@@ -30,10 +30,11 @@ This version streams Demucs/splitter output in real time (no buffering).
 import os
 import sys
 import json
+import functools
 import platform
 import argparse
+import selectors
 import subprocess
-import threading
 import time
 from pathlib import Path
 from typing import Optional, List, Tuple
@@ -49,24 +50,12 @@ def section(title: str) -> None:
     print("-" * 72, flush=True)
 
 # ---------- streaming runner (REAL-TIME OUTPUT) ----------
-def _spinner_stop_event():
-    return threading.Event()
-
-def _spinner(title: str, stop_evt, interval: float = 0.1) -> None:
-    frames = ["⠋","⠙","⠹","⠸","⠼","⠴","⠦","⠧","⠇","⠏"]
-    i = 0
-    while not stop_evt.is_set():
-        sys.stdout.write(f"\r[checkpoint] {title} {frames[i % len(frames)]}")
-        sys.stdout.flush()
-        time.sleep(interval)
-        i += 1
-    sys.stdout.write("\r" + " " * (len(title) + 20) + "\r")
-    sys.stdout.flush()
-
 def run_stream(cmd: List[str], cwd: Optional[Path] = None, env: Optional[dict] = None) -> int:
     """
     Run a command and stream its output in real time.
     We merge stderr into stdout so tqdm progress bars are visible.
+    No spinner thread: the child's own progress output (tqdm) covers it,
+    and a 100ms spinner just contends with the child for stdout.
     """
     log("$ " + " ".join(str(c) for c in cmd))
     proc = subprocess.Popen(
@@ -74,28 +63,52 @@ def run_stream(cmd: List[str], cwd: Optional[Path] = None, env: Optional[dict] =
         cwd=str(cwd) if cwd else None,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1,
-        universal_newlines=True,
+        bufsize=0,
         env=env
     )
 
-    stop_evt = _spinner_stop_event()
-    spin = threading.Thread(target=_spinner, args=("Running splitter...", stop_evt), daemon=True)
-    spin.start()
-
+    # Forward raw chunks instead of iterating lines: tqdm updates end in \r,
+    # not \n, so line iteration would hold them back; chunked os.read also
+    # means one syscall per pipe fill rather than per line. On POSIX we block
+    # in the selector (epoll/kqueue) so we can notice child exit without a
+    # Python-level busy loop; Windows pipes can't be select()ed, so there we
+    # just do blocking reads.
     try:
         assert proc.stdout is not None
-        for line in proc.stdout:
-            if line.strip():
-                # clear spinner line so tqdm lines print cleanly
-                sys.stdout.write("\r")
-                sys.stdout.flush()
-                print(line, end="")
+        out = sys.stdout.buffer
+        fd = proc.stdout.fileno()
+        if os.name == "nt":
+            while True:
+                try:
+                    chunk = os.read(fd, 65536)
+                except OSError:
+                    break
+                if not chunk:
+                    break
+                out.write(chunk)
+                out.flush()
+        else:
+            sel = selectors.DefaultSelector()
+            sel.register(proc.stdout, selectors.EVENT_READ)
+            try:
+                eof = False
+                while not eof:
+                    events = sel.select(timeout=1.0)
+                    if not events:
+                        if proc.poll() is not None:
+                            break
+                        continue
+                    for key, _ in events:
+                        data = os.read(key.fd, 65536)
+                        if not data:
+                            eof = True
+                            break
+                        out.write(data)
+                        out.flush()
+            finally:
+                sel.close()
     finally:
         proc.wait()
-        stop_evt.set()
-        spin.join()
 
     return proc.returncode
 
@@ -118,47 +131,110 @@ def find_musictechtools_root(start: Path) -> Path:
             return parent
     return start
 
-def find_stems_root(musictech_root: Path) -> Optional[Path]:
+def _find_stems_root_uncached(musictech_root: Path) -> Optional[Path]:
+    # One scandir pass instead of three iterdir sweeps; each viable child is
+    # stat-probed at most once per priority tier.
+    try:
+        with os.scandir(musictech_root) as it:
+            children = [(e.name, e.path) for e in it if e.is_dir(follow_symlinks=False)]
+    except OSError:
+        return None
+    lower_map = {n.lower(): p for n, p in children}
     for name in STEMS_DIR_CANDIDATE_NAMES:
-        p = musictech_root / name
-        if p.is_dir() and looks_like_stems_dir(p):
-            return p
-    for child in musictech_root.iterdir():
-        if child.is_dir():
-            nm = child.name.lower()
-            if "youtube2aud" in nm and "stem" in nm and looks_like_stems_dir(child):
-                return child
-    for child in musictech_root.iterdir():
-        if child.is_dir() and (child / "getlink.py").exists():
-            return child
+        p = lower_map.get(name.lower())
+        if p and looks_like_stems_dir(Path(p)):
+            return Path(p)
+    for n, p in children:
+        nl = n.lower()
+        if "youtube2aud" in nl and "stem" in nl and looks_like_stems_dir(Path(p)):
+            return Path(p)
+    for _, p in children:
+        if os.path.exists(os.path.join(p, "getlink.py")):
+            return Path(p)
     return None
 
+@functools.lru_cache(maxsize=8)
+def find_stems_root(musictech_root: Path) -> Optional[Path]:
+    """
+    Resolve the stems project root, caching the result on disk keyed by the
+    root directory's mtime so repeat launches skip the iterdir/stat passes.
+    """
+    cache = musictech_root / ".musictech_cache.json"
+    try:
+        mt = musictech_root.stat().st_mtime
+    except OSError:
+        return _find_stems_root_uncached(musictech_root)
+    try:
+        d = json.loads(cache.read_text(encoding="utf-8"))
+        if d.get("mtime") == mt and Path(d["stems_root"]).exists():
+            return Path(d["stems_root"])
+    except Exception:
+        pass
+    result = _find_stems_root_uncached(musictech_root)
+    if result:
+        try:
+            cache.write_text(json.dumps({"mtime": mt, "stems_root": str(result)}), encoding="utf-8")
+        except Exception:
+            pass
+    return result
+
 # ---------- wav discovery ----------
 def get_downloads_dir() -> Path:
     home = Path.home()
     candidate = home / "Downloads"
     return candidate if candidate.exists() else home
 
-def newest_wav_under(root: Path, within_hours: int = 24) -> Optional[Path]:
+def newest_wav_under(root: Path, within_hours: int = 24, limit: int = 5000) -> Optional[Path]:
+    """
+    Find the most recent .wav under root via an explicit scandir walk.
+    DirEntry.stat() reuses the data scandir already fetched, directories
+    older than the cutoff are pruned, and we bail after `limit` entries so
+    a huge Downloads tree can't stall the checkpoint.
+    """
     if not root.exists():
         return None
-    newest = None
-    newest_mtime = 0.0
-    cutoff = datetime.now().timestamp() - within_hours * 3600
-    for p in root.rglob("*.wav"):
+    cutoff = time.time() - within_hours * 3600
+    best: Optional[str] = None
+    best_t = 0.0
+    count = 0
+    stack = [str(root)]
+    while stack:
+        d = stack.pop()
         try:
-            t = p.stat().st_mtime
-        except Exception:
+            it = os.scandir(d)
+        except OSError:
             continue
-        if t >= cutoff and t > newest_mtime:
-            newest, newest_mtime = p, t
-    return newest
+        with it:
+            for e in it:
+                count += 1
+                if count > limit:
+                    return Path(best) if best else None
+                try:
+                    st = e.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                if e.is_dir(follow_symlinks=False):
+                    if st.st_mtime >= cutoff:
+                        stack.append(e.path)
+                elif e.name.lower().endswith(".wav") and st.st_mtime >= cutoff and st.st_mtime > best_t:
+                    best, best_t = e.path, st.st_mtime
+    return Path(best) if best else None
+
+@functools.lru_cache(maxsize=32)
+def _load_json_mt(path_str: str, mtime_ns: int) -> dict:
+    # mtime_ns keys the cache: a rewritten manifest gets re-parsed, an
+    # unchanged one is served from memory on repeat calls.
+    return json.loads(Path(path_str).read_text(encoding="utf-8"))
+
+@functools.lru_cache(maxsize=32)
+def _load_text_mt(path_str: str, mtime_ns: int) -> str:
+    return Path(path_str).read_text(encoding="utf-8")
 
 def read_manifest_for_wav(stems_root: Path) -> Optional[Path]:
     j = stems_root / "last_download.json"
     if j.exists():
         try:
-            data = json.loads(j.read_text(encoding="utf-8"))
+            data = _load_json_mt(str(j), j.stat().st_mtime_ns)
             wav = data.get("wav")
             if wav and Path(wav).exists():
                 return Path(wav)
@@ -172,7 +248,7 @@ def read_manifest_for_wav(stems_root: Path) -> Optional[Path]:
     t = stems_root / "last_download.txt"
     if t.exists():
         try:
-            txt = t.read_text(encoding="utf-8").strip()
+            txt = _load_text_mt(str(t), t.stat().st_mtime_ns).strip()
             if txt and txt.lower().endswith(".wav") and Path(txt).exists():
                 return Path(txt)
         except Exception:
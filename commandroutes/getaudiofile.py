@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import List, Tuple
 
 AUDIO_EXTS = {".wav", ".mp3", ".flac", ".aiff", ".aif", ".m4a", ".ogg", ".wma", ".aac"}
+_AUDIO_SUFFIX_TUPLE = tuple(AUDIO_EXTS)  # str.endswith(tuple) — one C-level pass, no allocs
 PAGE_SIZE = 20
 
 BOLD = "\033[1m"; DIM = "\033[2m"; RESET = "\033[0m"; CYAN = "\033[36m"; YELLOW = "\033[33m"
@@ -16,16 +17,47 @@ def dim(s): return f"{DIM}{s}{RESET}"
 def cyan(s): return f"{CYAN}{s}{RESET}"
 def yellow(s): return f"{YELLOW}{s}{RESET}"
 
+# hoisted: human_path runs per rendered row, so no Path.home() per call
+HOME_PATH = Path.home()
+HOME_STR = str(HOME_PATH)
+DOWNLOADS_PATH = HOME_PATH / "Downloads"
+
 def human_path(p: Path) -> str:
-    return str(p).replace(str(Path.home()), "~")
+    return str(p).replace(HOME_STR, "~")
+
+# Listing cache keyed by (dir, filter, dir mtime) so re-renders of the same
+# folder (page flips, bad commands) don't re-enumerate and re-sort it.
+_DIR_CACHE: dict = {}
+_DIR_CACHE_MAX = 16
 
 def list_dir(cur: Path, audio_only: bool) -> Tuple[List[Path], List[Path]]:
+    key = None
+    try:
+        key = (str(cur), audio_only, cur.stat().st_mtime_ns)
+        cached = _DIR_CACHE.get(key)
+        if cached:
+            return cached
+    except Exception:
+        pass
+    dir_names: List[str] = []
+    file_names: List[str] = []
     try:
-        items = list(cur.iterdir())
+        with os.scandir(cur) as it:
+            for e in it:
+                if e.is_dir():  # follow symlinks, matching the old iterdir listing
+                    dir_names.append(e.name)
+                elif e.is_file() and (not audio_only or e.name.lower().endswith(_AUDIO_SUFFIX_TUPLE)):
+                    file_names.append(e.name)
     except Exception:
-        items = []
-    dirs = sorted([x for x in items if x.is_dir()])
-    files = sorted([x for x in items if x.is_file() and (not audio_only or x.suffix.lower() in AUDIO_EXTS)])
+        pass
+    dir_names.sort()
+    file_names.sort()
+    dirs = [cur / n for n in dir_names]
+    files = [cur / n for n in file_names]
+    if key is not None:
+        if len(_DIR_CACHE) >= _DIR_CACHE_MAX:
+            _DIR_CACHE.clear()
+        _DIR_CACHE[key] = (dirs, files)
     return dirs, files
 
 def print_page(dirs: List[Path], files: List[Path], page: int):
@@ -40,8 +72,7 @@ def print_page(dirs: List[Path], files: List[Path], page: int):
     return len(rows)
 
 def default_start_dir() -> Path:
-    dl = Path.home() / "Downloads"
-    return dl if dl.exists() else Path.cwd()
+    return DOWNLOADS_PATH if DOWNLOADS_PATH.exists() else Path.cwd()
 
 def controls_line():
     # single compact line of controls — shown at the BOTTOM
@@ -91,14 +122,13 @@ def pick():
             audio_only = not audio_only; page = 0
             continue
         if c in ("dl","downloads"):
-            dl = Path.home() / "Downloads"
-            if dl.exists():
-                cur = dl; page = 0
+            if DOWNLOADS_PATH.exists():
+                cur = DOWNLOADS_PATH; page = 0
             else:
                 print(yellow("Downloads folder not found."))
             continue
         if c in ("home","~"):
-            cur = Path.home(); page = 0
+            cur = HOME_PATH; page = 0
             continue
 
         # direct path paste
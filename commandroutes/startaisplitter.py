@@ -19,14 +19,30 @@ Logging:
 
 import os
 import sys
+import json
 import time
+import atexit
+import codecs
 import shlex
 import shutil
+import struct
+import functools
+import threading
 import subprocess
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
 import re  # cross-platform
 
+# Optional: filesystem events for the picker wait (falls back to polling)
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+from _picker_launch import launch_picker
+
 # ----------------- logging -----------------
 def _timestamp() -> str:
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -42,19 +58,44 @@ def _project_root_from_here() -> str:
     parent = os.path.abspath(os.path.join(here, os.pardir))
     return parent if os.path.basename(here).lower() == "commandroutes" else here
 
+# makedirs stats the whole path even when it already exists; remember what
+# we've ensured this session so re-entrant helpers skip the syscalls
+_ENSURED_DIRS: set = set()
+
+def ensure_dir(p: str) -> None:
+    if p not in _ENSURED_DIRS:
+        os.makedirs(p, exist_ok=True)
+        _ENSURED_DIRS.add(p)
+
 PROJECT_ROOT = _project_root_from_here()
 LOG_DIR = os.path.join(PROJECT_ROOT, "logs", "startaisplitterlog")
-os.makedirs(LOG_DIR, exist_ok=True)
+ensure_dir(LOG_DIR)
 LOG_PATH = os.path.join(LOG_DIR, f"{_date_slug()}.log")
 
+# One O_APPEND descriptor for the whole session instead of an open/close
+# pair per logged line. O_APPEND writes are atomic per POSIX, so lines
+# from the PTY mirror and log() never interleave mid-line — no lock needed.
+_LOG_FD: Optional[int] = None
+
+def _session_log_fd() -> Optional[int]:
+    global _LOG_FD
+    if _LOG_FD is None:
+        try:
+            _LOG_FD = os.open(LOG_PATH, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            atexit.register(os.close, _LOG_FD)
+        except Exception:
+            _LOG_FD = -1  # don't retry on every line
+    return _LOG_FD if _LOG_FD >= 0 else None
+
 def log(msg: str) -> None:
     line = f"[{_timestamp()}] {msg}"
     print(line, flush=True)
-    try:
-        with open(LOG_PATH, "a", encoding="utf-8") as f:
-            f.write(line + "\n")
-    except Exception:
-        pass
+    fd = _session_log_fd()
+    if fd is not None:
+        try:
+            os.write(fd, (line + "\n").encode("utf-8", "replace"))
+        except Exception:
+            pass
 
 # ----------------- OS helpers -----------------
 def is_windows() -> bool:
@@ -86,113 +127,276 @@ def prompt_tty(prompt: str) -> str:
         return ""
 
 # ----------------- Locate files -----------------
-def require_picker_path(base_dir: str) -> Optional[str]:
+# PATH walks and isfile probes repeat with identical answers within one
+# session; cache them (a PATH lookup alone stats dozens of directories).
+_which = functools.lru_cache(maxsize=None)(shutil.which)
+_isfile = functools.lru_cache(maxsize=256)(os.path.isfile)
+
+# PROJECT_ROOT and the script dir never change within a run, so the
+# candidate path strings are resolved once here instead of re-joined and
+# re-normalized on every lookup. Deduped in priority order.
+_SCRIPT_DIR = _script_dir()
+
+def _candidate_tuple(rel_parts_list) -> tuple:
+    return tuple(dict.fromkeys(
+        abspath(base, *rel)
+        for base in (PROJECT_ROOT, _SCRIPT_DIR)
+        for rel in rel_parts_list
+    ))
+
+_PICKER_CANDIDATES = _candidate_tuple([
+    ("getaudiofile2.py",),
+    ("commandroutes", "getaudiofile2.py"),
+    (os.pardir, "plumming", "getaudiofile2.py"),
+])
+
+_CHECKPOINT_CANDIDATES = _candidate_tuple([
+    ("checkpoint.py",),
+    ("commandroutes", "checkpoint.py"),
+    (os.pardir, "commandroutes", "checkpoint.py"),
+])
+
+def require_picker_path() -> Optional[str]:
     """Require getaudiofile2.py (no legacy fallbacks)."""
-    candidates = [
-        abspath(base_dir, "getaudiofile2.py"),
-        abspath(base_dir, "commandroutes", "getaudiofile2.py"),
-        abspath(base_dir, os.pardir, "plumming", "getaudiofile2.py"),
-    ]
-    for p in candidates:
-        if os.path.isfile(p):
-            return p
-    return None
-
-def candidate_checkpoint_paths(base_dir: str) -> List[str]:
-    candidates = [
-        abspath(base_dir, "checkpoint.py"),
-        abspath(base_dir, "commandroutes", "checkpoint.py"),
-        abspath(base_dir, os.pardir, "commandroutes", "checkpoint.py"),
-    ]
-    return [p for p in candidates if os.path.isfile(p)]
+    return next((p for p in _PICKER_CANDIDATES if _isfile(p)), None)
+
+def candidate_checkpoint_paths() -> List[str]:
+    return [p for p in _CHECKPOINT_CANDIDATES if _isfile(p)]
 
 def candidate_temp_paths(project_root: str) -> List[str]:
-    paths = []
-    pr_tmp = abspath(project_root, ".tmp")
-    os.makedirs(pr_tmp, exist_ok=True)
-    paths.append(abspath(pr_tmp, "selected_audio_path.txt"))
+    paths = [abspath(project_root, ".tmp", "selected_audio_path.txt")]
     if is_macos():
         mac_tmp_root = abspath(os.path.expanduser("~/Library/Application Support/MusicTechTools/tmp"))
-        os.makedirs(mac_tmp_root, exist_ok=True)
         paths.append(abspath(mac_tmp_root, "selected_audio_path.txt"))
     if is_windows():
         la = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
-        win_tmp_root = abspath(la, "MusicTechTools", "tmp")
-        os.makedirs(win_tmp_root, exist_ok=True)
-        paths.append(abspath(win_tmp_root, "selected_audio_path.txt"))
+        paths.append(abspath(la, "MusicTechTools", "tmp", "selected_audio_path.txt"))
     paths.append("/tmp/musictechtools_selected_audio_path.txt")
+    # one makedirs per unique parent (system /tmp always exists)
+    for d in dict.fromkeys(os.path.dirname(p) for p in paths):
+        if d != "/tmp":
+            ensure_dir(d)
     return paths
 
+def clear_stale_temp_files(watch_paths: List[str]) -> None:
+    """Delete leftover picker temp files with one scandir per parent dir
+    instead of an exists+remove stat pair per candidate path."""
+    by_parent: dict = {}
+    for p in watch_paths:
+        by_parent.setdefault(os.path.dirname(p), set()).add(os.path.basename(p))
+    for parent, names in by_parent.items():
+        try:
+            with os.scandir(parent) as it:
+                for entry in it:
+                    if entry.name in names:
+                        try:
+                            os.unlink(entry.path)
+                            log(f"Cleared stale temp file: {entry.path}")
+                        except FileNotFoundError:
+                            pass
+                        except Exception as e:
+                            log(f"WARN: Could not clear {entry.path}: {e}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log(f"WARN: Could not scan {parent}: {e}")
+
 # ----------------- Launch picker in NEW TERMINAL -----------------
 def launch_picker_new_terminal(picker_py: str, temp_path: str, working_dir: str) -> None:
-    env_export = f'PICKER_TEMP_PATH={shlex.quote(temp_path)}'
-    inner = (
-        f'cd {shlex.quote(working_dir)}; '
-        f'export {env_export}; '
-        f'{shlex.quote(sys.executable)} {shlex.quote(picker_py)} --write-temp {shlex.quote(temp_path)}; '
-        r'printf "\nDone. You can close this window.\n"; '
-        'exec $SHELL'
+    launch_picker(
+        picker_py, temp_path,
+        env_var="PICKER_TEMP_PATH",
+        title="getaudiofile2.py",
+        working_dir=working_dir,
+        extra_args=("--write-temp", temp_path),
+        log=log,
     )
-    log(f"Picker command (inner shell): {inner}")
 
-    if is_macos():
-        inner_as = inner.replace("\\", "\\\\").replace('"', '\\"')
-        osa_script = (
-            f'tell application "Terminal"\n'
-            f'  activate\n'
-            f'  do script "{inner_as}"\n'
-            f'  set custom title of front window to "getaudiofile2.py"\n'
-            f'end tell'
-        )
-        log("Launching macOS Terminal via AppleScript.")
-        subprocess.Popen(["osascript", "-e", osa_script])
-    elif is_windows():
-        ps_inner = inner.replace('"', '\\"')
-        ps_command = (
-            f'$host.ui.RawUI.WindowTitle = "getaudiofile2.py"; '
-            f'{ps_inner}; '
-            'Write-Host ""; Write-Host "Done. You can close this window."; '
-            'powershell -NoExit'
-        )
-        log("Launching Windows PowerShell via Start-Process.")
-        subprocess.Popen([
-            "powershell", "-NoProfile", "-Command",
-            f'Start-Process powershell -ArgumentList \'-NoExit\', \'-Command\', "{ps_command}"'
-        ])
-    else:
-        log("Launching picker via shell (no GUI terminal available).")
-        subprocess.Popen(inner, shell=True)
+# ----------------- Picker result wait -----------------
+def _read_candidate(p: str) -> Optional[str]:
+    # The pickers write via tmp-file + os.replace, so the file either isn't
+    # there yet or holds the complete path — no torn reads, which lets this
+    # be a single open instead of the old exists+getsize+open chain.
+    try:
+        with open(p, "rb") as f:
+            raw = f.read(4096)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log(f"WARN: reading {p} failed: {e}")
+        return None
+    text = raw.decode("utf-8", "replace").strip().strip('"')
+    return text or None
+
+def _scan_watch_paths(watch_paths: List[str]) -> Tuple[Optional[str], Optional[str]]:
+    for p in watch_paths:
+        text = _read_candidate(p)
+        if text:
+            return p, text
+    return None, None
+
+def _wait_with_watchdog(watch_paths: List[str], timeout_s: float) -> Tuple[Optional[str], Optional[str]]:
+    """Sleep until the OS reports a create/modify on a watched temp file.
+    Re-scans on every wakeup (and every 30s as a missed-event guard)."""
+    wanted = {os.path.abspath(p) for p in watch_paths}
+    hit = threading.Event()
+
+    class _TempFileHandler(FileSystemEventHandler):
+        def on_created(self, event):
+            # the picker delivers via tmp-file + os.replace, which arrives
+            # as a move event carrying the final name in dest_path
+            candidate = getattr(event, "dest_path", "") or getattr(event, "src_path", "")
+            if os.path.abspath(candidate) in wanted:
+                hit.set()
+        on_moved = on_created
+        on_modified = on_created
+
+    observer = Observer()
+    handler = _TempFileHandler()
+    for d in {os.path.dirname(p) for p in wanted}:
+        if os.path.isdir(d):
+            observer.schedule(handler, d)
+    observer.start()
+    try:
+        deadline = time.monotonic() + timeout_s
+        while True:
+            found = _scan_watch_paths(watch_paths)
+            if found[1]:
+                return found
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None, None
+            hit.wait(timeout=min(remaining, 30.0))
+            hit.clear()
+    finally:
+        observer.stop()
+        observer.join(timeout=2)
+
+def _wait_with_polling(watch_paths: List[str], timeout_s: float,
+                       poll_interval: float = 0.4) -> Tuple[Optional[str], Optional[str]]:
+    waited = 0.0
+    while waited < timeout_s:
+        found = _scan_watch_paths(watch_paths)
+        if found[1]:
+            return found
+        time.sleep(poll_interval)
+        waited += poll_interval
+    return None, None
+
+def wait_for_selection(watch_paths: List[str], timeout_s: float) -> Tuple[Optional[str], Optional[str]]:
+    """Return (temp_path, selected_path) once the picker writes its result."""
+    found = _scan_watch_paths(watch_paths)  # picker may have written already
+    if found[1]:
+        return found
+    if Observer is not None:
+        return _wait_with_watchdog(watch_paths, timeout_s)
+    return _wait_with_polling(watch_paths, timeout_s)
 
 # ----------------- WAV ensure/convert -----------------
+_PROBE_CACHE: dict = {}
+
+def probe_audio(path: str) -> Optional[dict]:
+    """First audio stream info via ffprobe (codec/rate/channels), cached on
+    (path, mtime, size) so repeated ensure_wav calls don't re-probe."""
+    ffprobe = _which("ffprobe")
+    if not ffprobe:
+        return None
+    try:
+        st = os.stat(path)
+        key = (path, st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+    if key in _PROBE_CACHE:
+        return _PROBE_CACHE[key]
+    info = None
+    try:
+        out = subprocess.run(
+            [ffprobe, "-v", "error", "-print_format", "json",
+             "-show_streams", "-select_streams", "a:0", path],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+        streams = json.loads(out.stdout or b"{}").get("streams") or []
+        info = streams[0] if streams else None
+    except Exception:
+        info = None
+    _PROBE_CACHE[key] = info
+    return info
+
+def _probe_wav_header(path: str) -> Optional[tuple]:
+    """Parse (audio_format, channels, sample_rate, bits) from a RIFF/WAVE
+    header with one 44-byte read; None when it isn't a canonical wav."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read(44)
+    except OSError:
+        return None
+    if len(data) < 36 or data[0:4] != b"RIFF" or data[8:12] != b"WAVE" or data[12:16] != b"fmt ":
+        return None
+    fmt, channels, sample_rate, _byte_rate, _align, bits = struct.unpack("<HHIIHH", data[20:36])
+    return (fmt, channels, sample_rate, bits)
+
 def ensure_wav(selected_path: str) -> str:
     ext = os.path.splitext(selected_path)[1].lower()
     if ext == ".wav":
-        log("Selected file is already a .wav.")
-        return selected_path
-
-    ffmpeg = shutil.which("ffmpeg")
+        # Extension alone isn't enough — a float32 or 48kHz wav would still
+        # get bounced by checkpoint. 44 header bytes settle it without ffmpeg.
+        header = _probe_wav_header(selected_path)
+        if header is None or header == (1, 2, 44100, 16):
+            log("Selected file is already a .wav.")
+            return selected_path
+        log(f"Selected .wav isn't 16-bit/44.1kHz/stereo PCM (fmt/ch/rate/bits={header}); converting.")
+
+    ffmpeg = _which("ffmpeg")
     if not ffmpeg:
         log("WARN: ffmpeg not found; proceeding with original file (checkpoint may reprompt for .wav).")
         return selected_path
 
     base = os.path.splitext(os.path.basename(selected_path))[0]
     out_dir = abspath(PROJECT_ROOT, ".tmp")
-    os.makedirs(out_dir, exist_ok=True)
+    ensure_dir(out_dir)
     wav_out = abspath(out_dir, f"{base}.wav")
+    if os.path.abspath(selected_path) == wav_out:
+        wav_out = abspath(out_dir, f"{base}_44100.wav")  # never transcode onto the input
 
     log(f"Converting to WAV via ffmpeg:\n  IN:  {selected_path}\n  OUT: {wav_out}")
+    # Probe first so resample/remix stages only run when the stream actually
+    # needs them; pcm_s16le pins the sample format, so -sample_fmt goes away.
+    info = probe_audio(selected_path)
+    # PCM encode is memory-bound, not compute-bound — one thread is plenty,
+    # and extra workers only contend with the rest of the pipeline.
     cmd = [
-        ffmpeg, "-y",
+        ffmpeg, "-y", "-nostdin",
+        "-nostats", "-loglevel", "error",
+        "-threads", "1",
         "-i", selected_path,
-        "-ac", "2",
-        "-ar", "44100",
-        "-sample_fmt", "s16",
-        wav_out
+        "-map", "0:a", "-vn",
+        "-c:a", "pcm_s16le",
     ]
+    if not info or info.get("channels") != 2:
+        cmd += ["-ac", "2"]
+    if not info or info.get("sample_rate") != "44100":
+        cmd += ["-ar", "44100"]
+    cmd.append(wav_out)
     try:
-        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        # stdout goes straight to /dev/null and stderr through one big pipe
+        # buffer — ffmpeg only emits errors now (-nostats -loglevel error),
+        # so nothing accumulates in memory and the pipe can't stall it.
+        # run the conversion below normal priority so it never freezes the UI
+        nice_kwargs = (
+            {"creationflags": subprocess.BELOW_NORMAL_PRIORITY_CLASS}
+            if is_windows() else
+            {"preexec_fn": lambda: os.nice(10)}
+        )
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            bufsize=1024 * 1024,
+            **nice_kwargs,
+        )
+        _, err = proc.communicate()
         if proc.returncode != 0:
-            log(f"ffmpeg failed (code {proc.returncode}). stderr:\n{proc.stderr.decode(errors='ignore')}")
+            log(f"ffmpeg failed (code {proc.returncode}). stderr:\n{err.decode(errors='ignore')}")
             return selected_path  # fallback
         log("ffmpeg conversion successful.")
         return wav_out
@@ -201,15 +405,15 @@ def ensure_wav(selected_path: str) -> str:
         return selected_path
 
 # ----------------- PTY runner for checkpoint (POSIX) -----------------
-PROMPT_PATTERNS_WAV = [
-    re.compile(r"Paste absolute path to a \.wav", re.IGNORECASE),
-    re.compile(r"paste.*path.*wav", re.IGNORECASE),
-]
+# One fused alternation per prompt — a single .search() per chunk instead of
+# looping pattern lists. (The old MODE list also matched the CHECKPOINT
+# banner, but the answer was only ever sent on "Type 1 or 2", so that
+# alternative carried no signal.)
+PROMPT_RX_WAV = re.compile(r"Paste absolute path to a \.wav|paste.*path.*wav", re.IGNORECASE)
+PROMPT_RX_MODE = re.compile(r"Type\s+1\s+or\s+2", re.IGNORECASE)
 
-PROMPT_PATTERNS_MODE = [
-    re.compile(r"CHECKPOINT", re.IGNORECASE),          # banner appears before prompt
-    re.compile(r"Type\s+1\s+or\s+2", re.IGNORECASE),   # the actual prompt
-]
+# how much trailing output to keep for prompt matching across chunk boundaries
+_PROMPT_TAIL_CHARS = 2048
 
 def run_checkpoint_via_pty(args: List[str], cwd: Optional[str], env: dict, wav_line: str, mode_line: str) -> int:
     """
@@ -243,42 +447,85 @@ def run_checkpoint_via_pty(args: List[str], cwd: Optional[str], env: dict, wav_l
 
     sent_wav = False
     sent_mode = False
+    tail = ""  # rolling window so prompts split across reads still match
+    # one decoder for the whole session — a multibyte sequence split across
+    # two reads decodes correctly instead of turning into replacement chars
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    # one buffered appender for the whole run — not an open/close per chunk
+    try:
+        log_fp = open(LOG_PATH, "a", encoding="utf-8", buffering=1 << 16)
+    except Exception:
+        log_fp = None
+
+    # One persistent poll object beats rebuilding select()'s fd sets every
+    # 200ms, and 64KB reads cut the syscall count on verbose output.
+    poller = select.poll()
+    poller.register(master_fd, select.POLLIN | select.POLLHUP)
+
+    last_liveness = time.monotonic()
 
     try:
         while True:
-            rlist, _, _ = select.select([master_fd], [], [], 0.2)
-            if master_fd in rlist:
+            events = poller.poll(200)
+            if events:
                 try:
-                    chunk = os.read(master_fd, 4096)
+                    chunk = os.read(master_fd, 65536)
                 except BlockingIOError:
-                    chunk = b""
-                if chunk:
-                    text = chunk.decode(errors="replace")
-                    # echo to console
-                    print(text, end="", flush=True)
-                    # log to file
+                    continue
+                except OSError:
+                    break  # EIO: slave side closed, child has exited
+                if not chunk:
+                    break  # PTY EOF — no need to waitpid every tick
+                text = decoder.decode(chunk)
+                if not text:
+                    continue  # mid-sequence; bytes are buffered in the decoder
+                # echo to console
+                print(text, end="", flush=True)
+                # log to file
+                if log_fp is not None:
                     try:
-                        with open(LOG_PATH, "a", encoding="utf-8") as f:
-                            f.write(text)
+                        log_fp.write(text)
                     except Exception:
                         pass
 
-                    # Detect & answer WAV prompt once
-                    if not sent_wav and any(rx.search(text) for rx in PROMPT_PATTERNS_WAV):
-                        os.write(master_fd, (wav_line + "\n").encode())
-                        log("PTY: answered WAV path prompt.")
-                        sent_wav = True
-
-                    # Detect & answer Mode prompt once
-                    if not sent_mode and any(rx.search(text) for rx in PROMPT_PATTERNS_MODE):
-                        if re.search(r"Type\s+1\s+or\s+2", text, re.IGNORECASE):
-                            os.write(master_fd, (mode_line + "\n").encode())
-                            log(f"PTY: answered mode prompt with '{mode_line}'.")
-                            sent_mode = True
-
-            if proc.poll() is not None:
-                return proc.returncode
+                tail = (tail + text)[-_PROMPT_TAIL_CHARS:]
+
+                # Detect & answer WAV prompt once
+                if not sent_wav and PROMPT_RX_WAV.search(tail):
+                    os.write(master_fd, (wav_line + "\n").encode())
+                    log("PTY: answered WAV path prompt.")
+                    sent_wav = True
+
+                # Detect & answer Mode prompt once
+                if not sent_mode and PROMPT_RX_MODE.search(tail):
+                    os.write(master_fd, (mode_line + "\n").encode())
+                    log(f"PTY: answered mode prompt with '{mode_line}'.")
+                    sent_mode = True
+            else:
+                # Idle tick: a liveness waitpid at most every 5s covers the
+                # odd child that exits while the PTY stays open.
+                now_m = time.monotonic()
+                if now_m - last_liveness >= 5.0:
+                    last_liveness = now_m
+                    if proc.poll() is not None:
+                        break
+        leftover = decoder.decode(b"", final=True)
+        if leftover:
+            print(leftover, end="", flush=True)
+            if log_fp is not None:
+                try:
+                    log_fp.write(leftover)
+                except Exception:
+                    pass
+        return proc.wait()
     finally:
+        if log_fp is not None:
+            try:
+                log_fp.flush()
+                log_fp.close()
+            except Exception:
+                pass
         try:
             os.close(master_fd)
         except Exception:
@@ -291,7 +538,7 @@ def main() -> int:
     project_root = PROJECT_ROOT
 
     # Require getaudiofile2.py
-    picker_py = require_picker_path(project_root) or require_picker_path(_script_dir())
+    picker_py = require_picker_path()
     log(f"Picker candidates (must be getaudiofile2.py): {picker_py}")
     if not picker_py:
         log("ERROR: getaudiofile2.py not found. Put it in one of:")
@@ -302,7 +549,7 @@ def main() -> int:
     log(f"Using picker: {picker_py}")
 
     # checkpoint
-    checkpoints = candidate_checkpoint_paths(project_root) or candidate_checkpoint_paths(_script_dir())
+    checkpoints = candidate_checkpoint_paths()
     log(f"Checkpoint candidates: {checkpoints}")
     if not checkpoints:
         log("ERROR: Could not find checkpoint.py in expected locations.")
@@ -313,13 +560,7 @@ def main() -> int:
     # temp files
     watch_paths = candidate_temp_paths(project_root)
     temp_path = watch_paths[0]
-    for p in watch_paths:
-        try:
-            if os.path.exists(p):
-                os.remove(p)
-                log(f"Cleared stale temp file: {p}")
-        except Exception as e:
-            log(f"WARN: Could not clear {p}: {e}")
+    clear_stale_temp_files(watch_paths)
 
     log("Opening picker in a new terminal window...")
     launch_picker_new_terminal(picker_py=picker_py, temp_path=temp_path, working_dir=project_root)
@@ -327,33 +568,9 @@ def main() -> int:
     log("Waiting for selection (getaudiofile2.py)...")
     log("Watching temp paths:\n  • " + "\n  • ".join(watch_paths))
 
-    timeout_s = 60 * 10
-    poll_interval = 0.4
-    selected_path: Optional[str] = None
-    waited = 0.0
-
-    def read_candidate(p: str) -> Optional[str]:
-        try:
-            if os.path.exists(p) and os.path.getsize(p) > 0:
-                with open(p, "r", encoding="utf-8") as f:
-                    raw = f.read().strip()
-                if raw:
-                    return raw.strip().strip('"')
-        except Exception as e:
-            log(f"WARN: reading {p} failed: {e}")
-        return None
-
-    while waited < timeout_s and not selected_path:
-        for p in watch_paths:
-            text = read_candidate(p)
-            if text:
-                selected_path = text
-                log(f"Detected selection at: {p}")
-                break
-        if selected_path:
-            break
-        time.sleep(poll_interval)
-        waited += poll_interval
+    hit_path, selected_path = wait_for_selection(watch_paths, timeout_s=60 * 10)
+    if selected_path:
+        log(f"Detected selection at: {hit_path}")
 
     if not selected_path:
         log("ERROR: No file was selected (timeout waiting for picker).")
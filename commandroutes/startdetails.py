@@ -11,14 +11,34 @@ Behavior:
 
 import os
 import sys
+import select
+import selectors
 import subprocess
+import threading
 import time
-from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
+
+from _picker_launch import launch_picker
+
+# Optional: filesystem events for the picker wait (falls back to polling)
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
 
 # ----------------- Logging helpers -----------------
+# log() fires per streamed line; format the timestamp once per second
+# instead of paying datetime.now().strftime() on every call.
+_NOW_CACHE: Tuple[int, str] = (-1, "")
+
 def now() -> str:
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    global _NOW_CACHE
+    t = int(time.time())
+    if t != _NOW_CACHE[0]:
+        _NOW_CACHE = (t, time.strftime("%Y-%m-%d %H:%M:%S"))
+    return _NOW_CACHE[1]
 
 def log(msg: str) -> None:
     print(f"[{now()}] {msg}")
@@ -39,17 +59,28 @@ def first_existing(paths: List[str]) -> Optional[str]:
 
 def find_paths(repo_root: str):
     picker = first_existing([os.path.join(repo_root, "plumming", "getaudiofile1.py")])
-    details_dir = first_existing([
-        os.path.join(repo_root, "youtube2audwstems", "details"),
-        os.path.join(repo_root, "link2stems", "details"),
-    ])
+    # The candidate content roots share repo_root as their parent, so one
+    # scandir answers every "does this dir exist?" probe instead of a stat
+    # per candidate — and stays one scan if more roots get added later.
+    try:
+        with os.scandir(repo_root) as it:
+            root_dirs = {e.name for e in it if e.is_dir()}
+    except OSError:
+        root_dirs = set()
+    details_dir = None
+    for name in ("youtube2audwstems", "link2stems"):
+        if name in root_dirs:
+            cand = os.path.join(repo_root, name, "details")
+            if os.path.isdir(cand):
+                details_dir = cand
+                break
     findtemp = os.path.join(details_dir, "findtemp.py") if details_dir else None
     findkey  = os.path.join(details_dir, "findkey.py")  if details_dir else None
     return picker, details_dir, findtemp, findkey
 
 # ----------------- Subprocess helpers -----------------
-def stream_subprocess(cmd, timeout=None):
-    """Stream live output from a process."""
+def _stream_subprocess_lines(cmd, timeout=None):
+    """Line-by-line fallback for Windows, where pipes aren't selectable."""
     proc = subprocess.Popen(cmd, text=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
     start = time.time()
     while True:
@@ -65,14 +96,248 @@ def stream_subprocess(cmd, timeout=None):
             sys.stderr.write(err)
         if out == "" and err == "" and proc.poll() is not None:
             break
-    return proc.returncode or 0
+    for f in (proc.stdout, proc.stderr):
+        if f:
+            f.close()
+    # wait() reaps the child and returns the real exit status;
+    # `proc.returncode or 0` would have mapped a lingering None to 0.
+    try:
+        return proc.wait(timeout=1.0)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        return proc.wait()
+
+def stream_subprocess(cmd, timeout=None):
+    """Stream live output from a process.
+
+    Both pipes drain through one selector in 64KB raw chunks, so a chatty
+    stderr can't stall stdout (the old loop alternated blocking readline
+    calls between the two streams).
+    """
+    if os.name == "nt":
+        return _stream_subprocess_lines(cmd, timeout)
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=1 << 20
+    )
+    sel = selectors.DefaultSelector()
+    sinks = {
+        proc.stdout.fileno(): sys.stdout.buffer,
+        proc.stderr.fileno(): sys.stderr.buffer,
+    }
+    # one reusable 64KB buffer per pipe — readv fills it in place, so a
+    # chatty child doesn't allocate a fresh bytes object per chunk
+    bufs = {fd: memoryview(bytearray(65536)) for fd in sinks}
+    for f in (proc.stdout, proc.stderr):
+        os.set_blocking(f.fileno(), False)
+        sel.register(f, selectors.EVENT_READ)
+    deadline = (time.monotonic() + timeout) if timeout else None
+    while sinks:
+        remaining = None if deadline is None else deadline - time.monotonic()
+        if remaining is not None and remaining <= 0:
+            proc.kill()
+            log(f"Timeout reached for: {' '.join(cmd)}")
+            sel.close()
+            proc.stdout.close()
+            proc.stderr.close()
+            proc.wait()  # reap the killed child; -1 stays the reported code
+            return -1
+        # block until data, EOF, or the exact remaining budget — no fixed tick
+        for key, _ in sel.select(timeout=remaining):
+            fd = key.fileobj.fileno()
+            try:
+                n = os.readv(fd, [bufs[fd]])
+            except BlockingIOError:
+                continue
+            if n:
+                sink = sinks[fd]
+                sink.write(bufs[fd][:n])
+                sink.flush()
+            else:
+                sel.unregister(key.fileobj)
+                del sinks[fd]
+    sel.close()
+    proc.stdout.close()
+    proc.stderr.close()
+    return proc.wait()
+
+def stream_subprocesses(jobs):
+    """Run independent analysis commands concurrently, draining every pipe
+    through one selector and prefixing each output line with its label so
+    interleaved tempo/key output stays readable.
+
+    jobs is a list of (label, cmd, timeout); timeouts apply per process.
+    Returns {label: returncode} (-1 for a timeout kill).
+    """
+    if os.name == "nt":
+        return {label: _stream_subprocess_lines(cmd, timeout) for label, cmd, timeout in jobs}
+    start = time.time()
+    sel = selectors.DefaultSelector()
+    procs = {}
+    results = {}
+    partials = {}
+    open_count = 0
+    for label, cmd, timeout in jobs:
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=1 << 20
+        )
+        procs[label] = (proc, (start + timeout) if timeout else None, cmd)
+        for f, sink in ((proc.stdout, sys.stdout.buffer), (proc.stderr, sys.stderr.buffer)):
+            os.set_blocking(f.fileno(), False)
+            sel.register(f, selectors.EVENT_READ, (label, sink))
+            partials[f] = b""
+            open_count += 1
+    prefix = {label: f"[{label}] ".encode() for label, _, _ in jobs}
+    while open_count:
+        for key, _ in sel.select(timeout=0.2):
+            f = key.fileobj
+            label, sink = key.data
+            try:
+                data = os.read(f.fileno(), 65536)
+            except BlockingIOError:
+                continue
+            if data:
+                buf = partials[f] + data
+                *lines, partials[f] = buf.split(b"\n")
+                for line in lines:
+                    sink.write(prefix[label] + line + b"\n")
+                sink.flush()
+            else:
+                if partials[f]:
+                    sink.write(prefix[label] + partials[f] + b"\n")
+                    sink.flush()
+                sel.unregister(f)
+                del partials[f]
+                open_count -= 1
+        now_t = time.time()
+        for label, (proc, deadline, cmd) in procs.items():
+            if label not in results and deadline and now_t > deadline and proc.poll() is None:
+                proc.kill()
+                log(f"Timeout reached for: {' '.join(cmd)}")
+                results[label] = -1
+    sel.close()
+    for label, (proc, _, _) in procs.items():
+        proc.stdout.close()
+        proc.stderr.close()
+        code = proc.wait()
+        results.setdefault(label, code)
+    return results
+
+# ----------------- Picker result wait -----------------
+def _read_selection(path: str) -> Optional[str]:
+    # Contract with getaudiofile1.py: the picker writes to <path>.tmp and
+    # os.replace()s it into place, so the file either doesn't exist yet or
+    # holds the complete path — one read, no torn-write retry loop. Empty
+    # content still returns None as a safety net, keeping the wait alive.
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+def _wait_polling(path: str, timeout_s: float,
+                  proc: Optional[subprocess.Popen] = None) -> Optional[str]:
+    deadline = time.monotonic() + timeout_s
+    pidfd = None
+    if proc is not None and hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(proc.pid)
+        except OSError:
+            pidfd = None
+    # Start fast so a quick selection lands in tens of ms, back off toward
+    # 500ms so a long browse doesn't spin. PICKER_POLL_INTERVAL pins a fixed
+    # interval for filesystems where cheap polls are not cheap (e.g. NFS).
+    try:
+        fixed = float(os.environ.get("PICKER_POLL_INTERVAL", "") or 0) or None
+    except ValueError:
+        fixed = None
+    delay = fixed or 0.025
+    try:
+        while time.monotonic() < deadline:
+            val = _read_selection(path)
+            if val:
+                return val
+            if proc is not None and proc.poll() is not None:
+                # picker exited; one last read in case the write just landed
+                val = _read_selection(path)
+                if val is None:
+                    log("Picker exited without selecting a file.")
+                return val
+            interval = min(delay, deadline - time.monotonic())
+            if pidfd is not None:
+                # sleep on the process fd — the kernel wakes us the instant
+                # the picker exits instead of at the next tick
+                select.select([pidfd], [], [], interval)
+            else:
+                time.sleep(max(interval, 0))
+            if fixed is None:
+                delay = min(delay * 1.5, 0.5)
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
+    return None
+
+def wait_for_file(path: str, timeout_s: float,
+                  proc: Optional[subprocess.Popen] = None) -> Optional[str]:
+    """Wait until the picker writes `path`, then return its contents.
+
+    watchdog hands us the "file ready" event straight from the kernel
+    (inotify on Linux, FSEvents on macOS, ReadDirectoryChangesW on
+    Windows), so there are no periodic wakeups and none of the up-to-1s
+    detection lag of the old 180-iteration sleep loop. Plain 1s polling
+    remains the fallback when watchdog is not installed.
+
+    When the picker's own process handle is available (shell fallback
+    launch), its exit also ends the wait, so a cancelled picker returns
+    immediately instead of burning the full timeout.
+    """
+    if Observer is None:
+        return _wait_polling(path, timeout_s, proc)
+
+    got = threading.Event()
+    basename = os.path.basename(path)
+
+    class _Handler(FileSystemEventHandler):
+        def _check(self, event):
+            candidate = getattr(event, "dest_path", "") or event.src_path
+            if os.path.basename(candidate) == basename:
+                got.set()
+        on_created = _check
+        on_moved = _check
+        on_modified = _check
+
+    observer = Observer()
+    observer.schedule(_Handler(), os.path.dirname(path) or ".", recursive=False)
+    observer.start()
+    if proc is not None:
+        # proc.wait() blocks in waitpid, so picker exit fires the same event
+        threading.Thread(target=lambda: (proc.wait(), got.set()), daemon=True).start()
+    try:
+        deadline = time.monotonic() + timeout_s
+        while True:
+            # also covers a write that landed before the watch was in place
+            val = _read_selection(path)
+            if val:
+                return val
+            if proc is not None and proc.poll() is not None:
+                log("Picker exited without selecting a file.")
+                return None
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            # 30s cap is a safety re-scan in case an event was dropped
+            got.wait(timeout=min(remaining, 30.0))
+            got.clear()
+    finally:
+        observer.stop()
+        observer.join(timeout=2)
 
 # ----------------- Picker launcher (external terminal with real TTY) -----------------
 def launch_picker_in_new_terminal(picker_path: str) -> Optional[str]:
     """
     Launch getaudiofile1.py in an external terminal window with a real TTY.
-    The picker writes the selected path into a temp file specified by
-    the env var PICKER_OUTFILE. We poll that file from here.
+    The picker writes the selected path to <PICKER_OUTFILE>.tmp and
+    atomically renames it over the file named by the env var
+    PICKER_OUTFILE; we watch for that file from here (see wait_for_file).
     """
     log(f"[path] Found getaudiofile1.py: {picker_path}")
 
@@ -83,67 +348,17 @@ def launch_picker_in_new_terminal(picker_path: str) -> Optional[str]:
     except Exception:
         pass
 
-    if sys.platform.startswith("darwin"):
-        # macOS Terminal.app: open a new tab/window, set the tab title via AppleScript,
-        # export PICKER_OUTFILE, then run picker interactively with a real TTY.
-        title = "getaudiofile1.py"
-        picker_esc = picker_path.replace('"', '\\"')
-        out_esc = tmp_output.replace('"', '\\"')
-
-        # AppleScript avoids ANSI escapes; it directly sets the tab's custom title.
-        # We run a simple bash command that exports the env var and runs the picker.
-        # Note: use semicolons, not '&&', to keep it simple for AppleScript parsing.
-        shell_cmd = f'export PICKER_OUTFILE=\\"{out_esc}\\"; python3 \\"{picker_esc}\\"'
-
-        apple_script = (
-            'tell application "Terminal"\n'
-            f'    set newTab to do script "{shell_cmd}"\n'
-            f'    delay 0.1\n'
-            f'    set custom title of selected tab of front window to "{title}"\n'
-            'end tell'
-        )
-
-        log("Launching picker in macOS Terminal (with title)…")
-        subprocess.Popen(["osascript", "-e", apple_script])
-
-    elif os.name == "nt":
-        # Windows PowerShell: set title and env var, then run picker interactively in a new window
-        title = "getaudiofile1.py"
-        ps_cmd = (
-            f"$host.UI.RawUI.WindowTitle = '{title}'; "
-            f"$env:PICKER_OUTFILE = '{tmp_output}'; "
-            f"python \"{picker_path}\"; "
-            "exit"
-        )
-        log("Launching picker in Windows PowerShell (with title)…")
-        subprocess.Popen(["powershell", "-NoProfile", "-Command", ps_cmd], shell=True)
-
-    else:
-        # Fallback (Linux): try gnome-terminal/konsole/xterm; if none, run inline
-        env = os.environ.copy()
-        env["PICKER_OUTFILE"] = tmp_output
-        for term in (("gnome-terminal", "--"), ("konsole", "-e"), ("xterm", "-e")):
-            if subprocess.call(f"which {term[0]}", shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL) == 0:
-                log(f"Launching picker in {term[0]}…")
-                subprocess.Popen([term[0], term[1], sys.executable, picker_path], env=env)
-                break
-        else:
-            log("No external terminal detected; running picker inline (TTY required for curses).")
-            subprocess.Popen([sys.executable, picker_path], env=env)
+    # Shared launcher (see _picker_launch.py) handles the macOS/Windows/Linux
+    # terminal dispatch; the picker exports the env var and runs with a real TTY.
+    proc = launch_picker(picker_path, tmp_output, env_var="PICKER_OUTFILE",
+                         title="getaudiofile1.py", log=log)
 
-    # Poll for the output file written by the picker
+    # Wait for the output file written by the picker
     log("Waiting for picker to complete…")
-    for _ in range(180):  # up to 3 minutes
-        if os.path.exists(tmp_output):
-            try:
-                with open(tmp_output, "r", encoding="utf-8") as f:
-                    path = f.read().strip()
-            except Exception:
-                path = ""
-            if path:
-                log(f"Picker selected: {path}")
-                return path
-        time.sleep(1)
+    path = wait_for_file(tmp_output, timeout_s=180, proc=proc)  # up to 3 minutes
+    if path:
+        log(f"Picker selected: {path}")
+        return path
 
     log("Picker timeout or no file selected.")
     return None
@@ -182,21 +397,20 @@ def main():
     log(f"Selected file: {selected_path}")
     hr()
 
-    # 1) Tempo detection
+    # 1) Tempo + key detection — independent analyses of the same file, so
+    #    run them concurrently; wall clock drops to the slower of the two.
+    jobs = []
     if findtemp:
-        log("Running findtemp.py (tempo detection)…")
-        stream_subprocess([sys.executable, findtemp, selected_path], timeout=300)
+        jobs.append(("tempo", [sys.executable, findtemp, selected_path], 300))
     else:
         log("Skipping tempo detection (findtemp.py missing).")
-
-    hr()
-
-    # 2) Key detection
     if findkey:
-        log("Running findkey.py (key detection)…")
-        stream_subprocess([sys.executable, findkey, selected_path], timeout=600)
+        jobs.append(("key", [sys.executable, findkey, selected_path], 600))
     else:
         log("Skipping key detection (findkey.py missing).")
+    if jobs:
+        log("Running " + " + ".join(label for label, _, _ in jobs) + " detection…")
+        stream_subprocesses(jobs)
 
     hr()
     log("Details analysis complete!")
@@ -12,17 +12,42 @@ Checks & installs dependencies listed in requirements.txt.
 """
 
 import os
+import re
 import sys
+import json
+import functools
+import hashlib
 import platform
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import importlib
+import importlib.util
 from importlib import import_module
 
+# --deep-check restores the old behavior of actually importing each module
+# (catches broken installs that still have a spec).
+DEEP_CHECK = "--deep-check" in sys.argv[1:]
+
 LOG = []
-SEARCHED_PATHS = os.environ.get("PATH", "").split(os.pathsep)
 
-CLI_TOOLS = {"yt-dlp", "ffmpeg", "demucs"}
+CLI_TOOLS = frozenset({"yt-dlp", "ffmpeg", "demucs"})
+
+# simple aliasing for common package-name/module-name mismatches
+_PY_MOD_ALIAS = {
+    "yt-dlp": "yt_dlp",
+    "opencv-python": "cv2",
+    "scikit-learn": "sklearn",
+    "pysoundfile": "soundfile",
+    "soundfile": "soundfile",
+    "torchaudio": "torchaudio",
+    "torch": "torch",
+    "ffmpeg-python": "ffmpeg",
+    "selenium": "selenium",
+    "webdriver-manager": "webdriver_manager",
+    "demucs": "demucs",
+}
 
 def log(line: str):
     print(line, flush=True)
@@ -52,47 +77,140 @@ def load_requirements(root: Path) -> list[str]:
         lines.append(s)
     return lines
 
+# package[extra]==ver / >= / <= / ~= / != / markers — one C-level scan
+_SPEC_RE = re.compile(r"[\[<>=~!;\s]")
+
+@functools.cache
+def _req_base(req: str) -> str:
+    return _SPEC_RE.split(req, 1)[0]
+
 def is_cli_tool(name: str) -> bool:
-    base = name.split("==")[0].split(">=")[0].split("<=")[0].split("[")[0]
-    return base in CLI_TOOLS
+    # kept for API stability; hot paths test `base in CLI_TOOLS` directly
+    return _req_base(name) in CLI_TOOLS
 
+@functools.cache
 def py_mod_from_req(req: str) -> str:
     # naive mapping: package[extra]==ver → package
-    base = req.split("==")[0].split(">=")[0].split("<=")[0]
-    base = base.split("[")[0]
-    # simple aliasing for common mismatches
-    alias = {
-        "yt-dlp": "yt_dlp",
-        "opencv-python": "cv2",
-        "soundfile": "soundfile",
-        "torchaudio": "torchaudio",
-        "torch": "torch",
-        "ffmpeg-python": "ffmpeg",
-        "selenium": "selenium",
-        "webdriver-manager": "webdriver_manager",
-        "demucs": "demucs",
-    }
-    return alias.get(base, base.replace("-", "_"))
+    base = _req_base(req)
+    return _PY_MOD_ALIAS.get(base, base.replace("-", "_"))
 
-def check_cli(name: str) -> tuple[bool, str]:
+REQS_OK_FILE = Path.home() / ".cache" / "musictechtools" / "reqs.ok"
+
+def _reqs_key(root: Path) -> str | None:
+    """Hash of requirements.txt + interpreter; None when there is no requirements file."""
+    req = root / "requirements.txt"
+    if not req.exists():
+        return None
+    return hashlib.sha256(req.read_bytes() + sys.executable.encode() + sys.version.encode()).hexdigest()
+
+WHICH_CACHE_FILE = Path.home() / ".cache" / "musictechtools" / "which.json"
+_which_cache: dict | None = None
+
+def _path_state_key() -> str:
+    """Fingerprint of PATH contents; changes whenever PATH or any entry's mtime does."""
+    path_env = os.environ.get("PATH", "")
+    parts = [path_env]
+    for p in path_env.split(os.pathsep):
+        try:
+            parts.append(str(os.stat(p).st_mtime))
+        except OSError:
+            continue
+    return hashlib.blake2b("|".join(parts).encode()).hexdigest()[:16]
+
+def which_cached(name: str) -> str | None:
+    """shutil.which with an on-disk index so repeat runs skip the PATH scan."""
+    global _which_cache
+    if _which_cache is None:
+        try:
+            _which_cache = json.loads(WHICH_CACHE_FILE.read_text(encoding="utf-8"))
+        except Exception:
+            _which_cache = {}
+    key = _path_state_key()
+    entry = _which_cache.get(name)
+    if entry and entry.get("key") == key and (entry["path"] is None or Path(entry["path"]).exists()):
+        return entry["path"]
     path = shutil.which(name)
+    _which_cache[name] = {"key": key, "path": path}
+    try:
+        WHICH_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = WHICH_CACHE_FILE.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(_which_cache), encoding="utf-8")
+        tmp.replace(WHICH_CACHE_FILE)
+    except Exception:
+        pass
+    return path
+
+@functools.cache
+def _path_index() -> dict:
+    """
+    One scandir sweep over PATH → {executable basename (lowercased): full path}.
+    Checking N tools against the index costs N dict lookups instead of N
+    independent PATH scans. Earlier PATH entries win via setdefault.
+    """
+    index: dict = {}
+    if os.name == "nt":
+        exts = [e.lower() for e in os.environ.get("PATHEXT", "").split(os.pathsep) if e]
+    else:
+        exts = []
+    for d in os.environ.get("PATH", "").split(os.pathsep):
+        if not d or not os.path.isdir(d):
+            continue
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    if not e.is_file():
+                        continue
+                    nm = e.name.lower()
+                    index.setdefault(nm, e.path)
+                    for ext in exts:
+                        if nm.endswith(ext):
+                            index.setdefault(nm[: -len(ext)], e.path)
+        except OSError:
+            continue
+    return index
+
+def check_cli(name: str) -> tuple[bool, str]:
+    path = _path_index().get(name.lower()) or which_cached(name)
     if path:
         return True, f"{name} ==> Found ({path})"
-    searched = "\n      ".join(SEARCHED_PATHS)
+    # Only built on failure; the split is pointless on the happy path.
+    searched = "\n      ".join(os.environ.get("PATH", "").split(os.pathsep))
     return False, f"{name} ==> !MIA! (searched PATH entries below)\n      {searched}"
 
 def check_py(req: str) -> tuple[bool, str]:
     mod = py_mod_from_req(req)
+    if DEEP_CHECK:
+        try:
+            import_module(mod)
+            return True, f"{req} ==> Found (python import '{mod}')"
+        except Exception as e:
+            return False, f"{req} ==> !MIA! (python import '{mod}' failed: {e})"
+    # find_spec only locates the module — no top-level code runs, so heavy
+    # packages (torch, demucs) don't get fully loaded just to be discarded.
     try:
-        import_module(mod)
-        return True, f"{req} ==> Found (python import '{mod}')"
-    except Exception as e:
-        return False, f"{req} ==> !MIA! (python import '{mod}' failed: {e})"
+        spec = importlib.util.find_spec(mod)
+    except (ValueError, ModuleNotFoundError, ImportError) as e:
+        return False, f"{req} ==> !MIA! (module '{mod}' lookup failed: {e})"
+    if spec is None:
+        return False, f"{req} ==> !MIA! (no module spec for '{mod}')"
+    return True, f"{req} ==> Found (spec: {spec.origin})"
 
 def main():
     root = Path(__file__).resolve().parent
     os_label = detect_os()
 
+    # Skip the whole sweep when requirements.txt (and the interpreter) are
+    # unchanged since the last successful check. --force bypasses.
+    reqs_key = _reqs_key(root)
+    if reqs_key and "--force" not in sys.argv[1:]:
+        try:
+            if REQS_OK_FILE.read_text(encoding="utf-8").strip() == reqs_key:
+                log("Requirements unchanged since last successful check (use --force to re-check).")
+                print("DONE!")
+                sys.exit(0)
+        except Exception:
+            pass
+
     hr()
     log(f"OS: {os_label}")
     hr()
@@ -107,18 +225,22 @@ def main():
     missing_py: list[str] = []
 
     log("Scanning dependencies declared in requirements.txt ...")
-    for req in reqs:
-        base = req.split("==")[0].split(">=")[0].split("<=")[0].split("[")[0]
-        if is_cli_tool(base):
-            ok, msg = check_cli(base)
+    # Checks are independent I/O-bound probes (PATH stats / module imports),
+    # so run them concurrently and report results in input order.
+    prepared = [(req, _req_base(req)) for req in reqs]
+    with ThreadPoolExecutor(max_workers=min(32, len(prepared))) as ex:
+        futures = [
+            ex.submit(check_cli, base) if base in CLI_TOOLS else ex.submit(check_py, req)
+            for req, base in prepared
+        ]
+        for (req, base), fut in zip(prepared, futures):
+            ok, msg = fut.result()
             log(msg)
             if not ok:
-                missing_cli.append(base)
-        else:
-            ok, msg = check_py(req)
-            log(msg)
-            if not ok:
-                missing_py.append(req)
+                if base in CLI_TOOLS:
+                    missing_cli.append(base)
+                else:
+                    missing_py.append(req)
 
     hr()
     if missing_cli or missing_py:
@@ -135,10 +257,18 @@ def main():
         if missing_py:
             log("Attempting to install missing Python packages via pip:")
             try:
-                # Install only the missing python packages (keep version specifiers)
-                subprocess.run([sys.executable, "-m", "pip", "install", "--upgrade", *missing_py], check=True)
+                # Install only the missing python packages (keep version specifiers).
+                # No --upgrade by default: it forces the resolver to re-evaluate every
+                # transitive dep. A shared cache dir lets re-runs hit wheels directly.
+                pip_cmd = [sys.executable, "-m", "pip", "install",
+                           "--disable-pip-version-check", "--no-input"]
+                if "--upgrade" in sys.argv[1:]:
+                    pip_cmd.append("--upgrade")
+                pip_env = {**os.environ, "PIP_CACHE_DIR": str(Path.home() / ".cache" / "musictechtools" / "pip")}
+                subprocess.run([*pip_cmd, *missing_py], check=True, env=pip_env)
                 log("Python package installation complete. Re-checking imports...")
-                # Re-check
+                # Re-check (freshly installed packages need invalidated finder caches)
+                importlib.invalidate_caches()
                 re_missing = []
                 for req in missing_py:
                     ok, msg = check_py(req)
@@ -169,6 +299,12 @@ def main():
             sys.exit(1)
 
     log("All dependencies OK.")
+    if reqs_key:
+        try:
+            REQS_OK_FILE.parent.mkdir(parents=True, exist_ok=True)
+            REQS_OK_FILE.write_text(reqs_key, encoding="utf-8")
+        except Exception:
+            pass
     print("DONE!")
     sys.exit(0)
 
@@ -20,6 +20,12 @@ from pathlib import Path
 import re
 import datetime
 
+# Compiled once at import so a pattern typo fails loudly at load time,
+# not on the first summary after a long analysis run.
+_AGGREGATE_BPM_RE = re.compile(
+    r"Aggregate\s*\(median\)\s*:\s*([0-9]+(?:\.[0-9]+)?)\s*BPM", re.IGNORECASE
+)
+
 def run_findtemp(wav_path: Path, repo_root: Path) -> str:
     findtemp_py = repo_root / "details" / "findtemp.py"
     if not findtemp_py.is_file():
@@ -38,7 +44,7 @@ def run_findtemp(wav_path: Path, repo_root: Path) -> str:
 
 def parse_aggregate_bpm(text: str) -> str:
     # Looks for a line like: "Aggregate (median): 130.81 BPM"
-    m = re.search(r"Aggregate\s*\(median\)\s*:\s*([0-9]+(?:\.[0-9]+)?)\s*BPM", text, re.IGNORECASE)
+    m = _AGGREGATE_BPM_RE.search(text)
     return m.group(1) if m else ""
 
 def main():
@@ -30,10 +30,11 @@ def _ua() -> str:
             "AppleWebKit/537.36 (KHTML, like Gecko) "
             "Chrome/127.0.0.0 Safari/537.36")
 
-INVALID = r'[<>:"/\\|?*\x00-\x1F]'
+INVALID = re.compile(r'[<>:"/\\|?*\x00-\x1F]')
+_MULTI_WS = re.compile(r"\s{2,}")
 def _sanitize(s: str) -> str:
-    s = re.sub(INVALID, " ", s).strip()
-    s = re.sub(r"\s{2,}", " ", s)
+    s = INVALID.sub(" ", s).strip()
+    s = _MULTI_WS.sub(" ", s)
     return s or "YouTube_Audio"
 
 def _title(ytdlp: str, url: str) -> str:
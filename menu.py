@@ -4,6 +4,9 @@
 import sys
 import shutil
 import subprocess
+import importlib.util
+import importlib.metadata
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, Tuple
 
@@ -58,23 +61,33 @@ def which_exe(name: str) -> Optional[str]:
     return shutil.which(name)
 
 def check_python_import(modname: str) -> Tuple[bool, Optional[str]]:
+    # find_spec only locates the module; it never executes top-level code,
+    # so the menu doesn't fully load torch/essentia just to tick a box.
     try:
-        mod = __import__(modname)
-        ver = getattr(mod, "__version__", None)
-        return True, ver
+        spec = importlib.util.find_spec(modname)
     except Exception:
         return False, None
+    if spec is None:
+        return False, None
+    try:
+        ver = importlib.metadata.version(modname)
+    except Exception:
+        ver = None
+    return True, ver
 
 def show_dependencies():
     print(bold("\nDependency Check"))
     print(dim("Looking for required tools & libraries...\n"))
+    # PATH scans and module probes are independent I/O — overlap them and
+    # print after the pool joins so output order stays deterministic.
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        exe_paths = list(ex.map(which_exe, EXEC_DEPS.values()))
+        mod_results = list(ex.map(check_python_import, PY_DEPS))
     print(bold("Executables"))
-    for label, exe in EXEC_DEPS.items():
-        path = which_exe(exe)
+    for (label, _), path in zip(EXEC_DEPS.items(), exe_paths):
         print(f"  {green('['+CHECK+']')+' ' if path else red('['+CROSS+'] ')}{label:<10} {dim(path) if path else red('not found')}")
     print(bold("\nPython Modules"))
-    for mod in PY_DEPS:
-        ok, ver = check_python_import(mod)
+    for mod, (ok, ver) in zip(PY_DEPS, mod_results):
         v = f" v{ver}" if (ok and ver) else ""
         print(f"  {green('['+CHECK+']') if ok else red('['+CROSS+']')} {mod:<10}{dim(v) if ok else red(' not importable')}")
     print()
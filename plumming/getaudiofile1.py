@@ -240,8 +240,11 @@ def main() -> None:
     outfile = os.environ.get("PICKER_OUTFILE", "").strip()
     if outfile:
         try:
-            with open(outfile, "w", encoding="utf-8") as f:
+            # tmp + rename so the orchestrator never reads a partial path
+            tmp = outfile + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
                 f.write(path_str)
+            os.replace(tmp, outfile)
         except Exception as e:
             sys.stderr.write(f"[getaudiofile1] WARN: Could not write PICKER_OUTFILE: {e}\n")
 
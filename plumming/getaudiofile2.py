@@ -49,10 +49,15 @@ def clear_screen():
 def write_selection(temp_path: str, chosen_abs: str) -> int:
     try:
         os.makedirs(os.path.dirname(temp_path), exist_ok=True)
-        with open(temp_path, "w", encoding="utf-8") as f:
+        # write to a sibling tmp file and rename into place — the watcher in
+        # startaisplitter.py opens temp_path directly and relies on never
+        # seeing a half-written file
+        tmp = temp_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
             f.write(chosen_abs)
             f.flush()
             os.fsync(f.fileno())
+        os.replace(tmp, temp_path)
         print(chosen_abs)
         print("Selection saved.")
         return 0